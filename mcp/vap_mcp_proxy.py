@@ -21,6 +21,8 @@ Usage:
 
 Configuration:
     Set VAP_API_KEY environment variable (VAPE_API_KEY alias also supported).
+    Set VAP_CACHE_DISABLE=1 to bypass the in-process response cache.
+    Set VAP_MAX_FRAME_BYTES to change the request size limit (default 256 KiB).
 
 Claude Desktop config (~/.config/Claude/claude_desktop_config.json):
 {
@@ -46,17 +48,37 @@ Directive: #549 (HTTP Mode for Glama)
 import sys
 import json
 import os
+import asyncio
 import logging
 import argparse
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
-# Use httpx for async HTTP (pip install httpx)
+# httpx is required (pip install httpx)
+import httpx
+
+# orjson is optional (pip install orjson) - much faster JSON for the
+# framing hot path. Both helpers work on bytes.
 try:
-    import httpx
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. integers over 64 bits, which the stdlib encoder handles
+            return json.dumps(obj).encode('utf-8')
 except ImportError:
-    # Fallback to requests if httpx not available
-    import requests as httpx
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
 
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -65,6 +87,28 @@ except ImportError:
 API_URL = os.getenv("VAP_API_URL", os.getenv("VAPE_API_URL", "https://api.vapagent.com/mcp")).strip()
 # Support both VAP_API_KEY and the earlier VAPE_API_KEY env alias.
 API_KEY = os.getenv("VAP_API_KEY", os.getenv("VAPE_API_KEY", "")).strip()
+
+# Request headers never change for the life of the process
+_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    **({"Authorization": f"Bearer {API_KEY}"} if API_KEY else {}),
+})
+
+# tools/list and resources/list change only on server deploys; finished
+# tasks never change. Cache them in-process to skip redundant round-trips.
+CACHE_DISABLED = bool(os.getenv("VAP_CACHE_DISABLE"))
+LIST_CACHE_TTL = 300.0
+TASK_CACHE_TTL = 600.0
+# Bound on cached results; expired entries are swept, then the oldest go
+CACHE_MAX_ENTRIES = 1024
+TERMINAL_TASK_STATUSES = ("completed", "failed")
+# Cost estimators are pure functions of their arguments
+ESTIMATE_TOOLS = frozenset({"estimate_cost", "estimate_video_cost", "estimate_music_cost"})
+ESTIMATE_CACHE_TTL = 300.0
+
+# Requests larger than this are rejected unparsed, bounding the CPU and
+# memory a misbehaving client can cost us
+MAX_FRAME_BYTES = int(os.getenv("VAP_MAX_FRAME_BYTES", str(256 * 1024)))
 
 # Logging to stderr so it doesn't interfere with stdio
 logging.basicConfig(
@@ -73,48 +117,215 @@ logging.basicConfig(
     stream=sys.stderr
 )
 logger = logging.getLogger(__name__)
+# Checked once so debug-only formatting (payload dumps, previews) is
+# skipped entirely at INFO level.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # HTTP CLIENT
 # ═══════════════════════════════════════════════════════════════════════════
 
-def make_request(endpoint: str, payload: Optional[Dict] = None) -> Dict[str, Any]:
-    """Make HTTP request to VAP MCP API."""
-    url = f"{API_URL}{endpoint}"
-    headers = {
-        "Content-Type": "application/json",
-    }
-    if API_KEY:
-        headers["Authorization"] = f"Bearer {API_KEY}"
+# Shared client: reuses pooled keep-alive connections across tool calls
+# instead of paying a fresh TCP + TLS handshake per request. It is bound to
+# the single event loop the proxy runs on (see run_stdio / run_http_server).
+# The transport retries failed connection attempts; _do retries transient
+# gateway statuses. A 502 or 504 is ambiguous - the upstream may have
+# accepted the job - so tool calls that can start a billable generation
+# retry only 429 and 503, which mean the request was not processed.
+_HTTP = httpx.AsyncClient(
+    timeout=httpx.Timeout(60.0),
+    headers=_HEADERS,
+    transport=httpx.AsyncHTTPTransport(
+        retries=3,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+    ),
+)
+# Calls that are safe to repeat (lists, resources, get_task, estimates)
+RETRY_STATUSES = frozenset({429, 502, 503})
+# Any other tools/call
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429, 503})
+MAX_STATUS_RETRIES = 3
+MAX_RETRY_AFTER = 60.0
+
+
+# Full URLs for the fixed set of MCP endpoints, built once
+_URLS = {
+    endpoint: API_URL + endpoint
+    for endpoint in (
+        "/initialize",
+        "/tools/list",
+        "/tools/call",
+        "/resources/list",
+        "/resources/read",
+    )
+}
+
 
-    logger.debug(f"Request: POST {url}")
-    logger.debug(f"Payload: {json.dumps(payload)}")
+async def close_http_client():
+    """Close the shared HTTP client (must run on the proxy's event loop)."""
+    await _HTTP.aclose()
 
+
+def _error_message(response: httpx.Response) -> str:
+    """Build an error message from a failed response, including the API's reason."""
     try:
-        if hasattr(httpx, 'Client'):
-            # httpx
-            with httpx.Client(timeout=60.0) as client:
-                response = client.post(url, json=payload or {}, headers=headers)
-                response.raise_for_status()
-                return response.json()
-        else:
-            # requests fallback
-            response = httpx.post(url, json=payload or {}, headers=headers, timeout=60)
-            response.raise_for_status()
+        body = response.json()
+    except ValueError:
+        body = response.text[:500]
+    if isinstance(body, dict):
+        body = body.get("error") or body.get("detail") or body.get("message") or body
+    return f"HTTP {response.status_code}: {body}"
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else backoff with jitter."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+        except ValueError:
+            pass  # HTTP-date form - fall back to backoff
+    return min(2 ** attempt, 8) + random.random() * 0.25
+
+
+async def _do(
+    method: str,
+    url: str,
+    json_body: Optional[Dict] = None,
+    timeout: float = 60.0,
+    raw: bool = False,
+    retry_statuses: frozenset = RETRY_STATUSES,
+) -> Any:
+    """Send a request with the shared client and return the decoded JSON body.
+
+    With raw=True a well-formed JSON object body without an "error" key is
+    returned as a RawResult of its own bytes, for results that are passed
+    through to the client unchanged.
+    Failures are returned as {"error": message} instead of raised.
+    """
+    if _DEBUG:
+        logger.debug("Request: %s %s", method, url)
+        logger.debug("Payload: %s", json.dumps(json_body))
+
+    try:
+        for attempt in range(MAX_STATUS_RETRIES + 1):
+            response = await _HTTP.request(method, url, json=json_body, timeout=timeout)
+            if response.status_code not in retry_statuses or attempt == MAX_STATUS_RETRIES:
+                break
+            delay = _retry_delay(response, attempt)
+            logger.warning(f"HTTP {response.status_code} from {url}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        if not response.is_error:
+            if raw:
+                body = response.content.strip()
+                try:
+                    data = _loads(body)
+                except ValueError:
+                    data = None
+                # Anything else (malformed, or an upstream error) takes the
+                # dict path below, so the client gets a JSON-RPC error
+                if isinstance(data, dict) and "error" not in data:
+                    # Raw newlines in valid JSON can only be insignificant
+                    # whitespace; drop them so the stdio frame stays one line
+                    if b"\n" in body:
+                        body = body.replace(b"\r", b"").replace(b"\n", b"")
+                    return RawResult(body)
             return response.json()
+        message = _error_message(response)
     except Exception as e:
-        logger.error(f"HTTP error: {e}")
-        return {"error": str(e)}
+        message = str(e)
+
+    logger.error(f"HTTP error: {message}")
+    return {"error": message}
+
+
+async def make_request(
+    endpoint: str,
+    payload: Optional[Dict] = None,
+    raw: bool = False,
+    retry_statuses: frozenset = RETRY_STATUSES,
+) -> Any:
+    """Make HTTP request to VAP MCP API."""
+    url = _URLS.get(endpoint) or API_URL + endpoint
+    return await _do("POST", url, payload or {}, raw=raw, retry_statuses=retry_statuses)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
+# RESPONSE CACHE
+# ═══════════════════════════════════════════════════════════════════════════
+
+# key -> (expires_at, result)
+_CACHE: Dict[tuple, tuple] = {}
+
+
+def _get_cached(key: tuple) -> Optional[Dict]:
+    """Return a cached result, or None if missing, expired or disabled."""
+    if CACHE_DISABLED:
+        return None
+    entry = _CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if expires_at < time.monotonic():
+        _CACHE.pop(key, None)
+        return None
+    return result
+
+
+def _set_cached(key: tuple, result: Any, ttl: float):
+    """Cache a successful result for ttl seconds."""
+    if CACHE_DISABLED:
+        return
+    if isinstance(result, dict) and "error" in result:
+        return
+
+    now = time.monotonic()
+    _CACHE.pop(key, None)  # Re-insert at the end so eviction order stays by age
+    if len(_CACHE) >= CACHE_MAX_ENTRIES:
+        for stale in [k for k, (expires_at, _) in _CACHE.items() if expires_at < now]:
+            del _CACHE[stale]
+        while len(_CACHE) >= CACHE_MAX_ENTRIES:
+            del _CACHE[next(iter(_CACHE))]
+    _CACHE[key] = (now + ttl, result)
+
+
+def _tool_cache_key(tool_name: str, arguments: Dict) -> Optional[tuple]:
+    """Return the cache key for a cacheable tool call, or None."""
+    if not isinstance(arguments, dict):
+        return None
+    if tool_name == "get_task":
+        task_id = arguments.get("task_id")
+        try:
+            hash(task_id)
+        except TypeError:
+            return None
+        return ("get_task", task_id)
+    if tool_name in ESTIMATE_TOOLS:
+        try:
+            return (tool_name, frozenset(arguments.items()))
+        except TypeError:
+            # Unhashable argument values - just don't cache
+            return None
+    return None
+
+
+def _is_finished_task(result: Dict) -> bool:
+    """Check whether a get_task result reports a terminal task status."""
+    if result.get("isError"):
+        return False
+    structured = result.get("structuredContent") or {}
+    return structured.get("status") in TERMINAL_TASK_STATUSES
+
+
+# ═══════════════════════════════════════════════════════════════════════════
 # MCP METHOD HANDLERS
 # ═══════════════════════════════════════════════════════════════════════════
 
-def handle_initialize(params: Dict) -> Dict:
+async def handle_initialize(params: Dict) -> Dict:
     """Handle initialize request."""
-    response = make_request("/initialize", {
+    response = await make_request("/initialize", {
         "protocolVersion": params.get("protocolVersion"),
         "capabilities": params.get("capabilities", {}),
         "clientInfo": params.get("clientInfo", {})
@@ -122,33 +333,63 @@ def handle_initialize(params: Dict) -> Dict:
     return response
 
 
-def handle_tools_list(params: Dict) -> Dict:
+async def handle_tools_list(params: Dict) -> Dict:
     """Handle tools/list request."""
-    response = make_request("/tools/list", {})
+    cache_key = ("/tools/list",)
+    response = _get_cached(cache_key)
+    if response is None:
+        # Passed through as the API's own bytes; frames only splice in the id
+        response = await make_request("/tools/list", {}, raw=True)
+        _set_cached(cache_key, response, LIST_CACHE_TTL)
     return response
 
 
-def handle_tools_call(params: Dict) -> Dict:
+async def handle_tools_call(params: Dict) -> Dict:
     """Handle tools/call request by forwarding to the remote VAP MCP API."""
     tool_name = params.get("name", "")
-    arguments = params.get("arguments", {})
+    arguments = params.get("arguments") or {}
 
-    response = make_request("/tools/call", {
+    # Answer repeated cost estimates and polls of finished tasks from the
+    # cache, before building the upstream request at all
+    cache_key = _tool_cache_key(tool_name, arguments)
+    if cache_key is not None:
+        cached = _get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+    # Only read-only tools may be repeated after an ambiguous 502
+    if tool_name == "get_task" or tool_name in ESTIMATE_TOOLS:
+        retry_statuses = RETRY_STATUSES
+    else:
+        retry_statuses = NON_IDEMPOTENT_RETRY_STATUSES
+
+    response = await make_request("/tools/call", {
         "name": tool_name,
         "arguments": arguments
-    })
+    }, retry_statuses=retry_statuses)
+
+    if cache_key is not None:
+        if tool_name == "get_task":
+            if _is_finished_task(response):
+                _set_cached(cache_key, response, TASK_CACHE_TTL)
+        elif not response.get("isError"):
+            _set_cached(cache_key, response, ESTIMATE_CACHE_TTL)
     return response
 
 
-def handle_resources_list(params: Dict) -> Dict:
+async def handle_resources_list(params: Dict) -> Dict:
     """Handle resources/list request."""
-    response = make_request("/resources/list", {})
+    cache_key = ("/resources/list",)
+    response = _get_cached(cache_key)
+    if response is None:
+        response = await make_request("/resources/list", {}, raw=True)
+        _set_cached(cache_key, response, LIST_CACHE_TTL)
     return response
 
 
-def handle_resources_read(params: Dict) -> Dict:
+async def handle_resources_read(params: Dict) -> Dict:
     """Handle resources/read request."""
-    response = make_request("/resources/read", {
+    response = await make_request("/resources/read", {
         "params": {"uri": params.get("uri")}
     })
     return response
@@ -168,6 +409,10 @@ METHOD_HANDLERS = {
 # JSON-RPC PROTOCOL
 # ═══════════════════════════════════════════════════════════════════════════
 
+class RawResult(bytes):
+    """A JSON-RPC result that is already serialized to JSON bytes."""
+
+
 def create_response(id: Any, result: Any) -> Dict:
     """Create JSON-RPC success response."""
     return {
@@ -189,7 +434,18 @@ def create_error(id: Any, code: int, message: str) -> Dict:
     }
 
 
-def process_request(request: Dict) -> Optional[Dict]:
+def encode_response(response: Dict) -> bytes:
+    """Serialize a JSON-RPC response, splicing in pre-serialized results."""
+    result = response.get("result")
+    if isinstance(result, RawResult):
+        return (
+            b'{"jsonrpc":"2.0","id":' + _dumps(response["id"])
+            + b',"result":' + result + b'}'
+        )
+    return _dumps(response)
+
+
+async def process_request(request: Dict) -> Optional[Dict]:
     """Process a JSON-RPC request or notification.
 
     Returns:
@@ -206,24 +462,30 @@ def process_request(request: Dict) -> Optional[Dict]:
         if method == "notifications/initialized":
             logger.info("Client initialized successfully")
         elif method.startswith("notifications/"):
-            logger.debug(f"Received notification: {method}")
+            logger.debug("Received notification: %s", method)
         else:
             logger.warning(f"Unknown notification: {method}")
         return None  # DON'T SEND RESPONSE FOR NOTIFICATIONS
 
     logger.info(f"Processing method: {method}")
 
-    # Find handler for requests
-    handler = METHOD_HANDLERS.get(method)
+    # Find handler for requests: branch straight to the hot methods and
+    # fall back to the routing table for everything else
+    if method == "tools/call":
+        handler = handle_tools_call
+    elif method == "tools/list":
+        handler = handle_tools_list
+    else:
+        handler = METHOD_HANDLERS.get(method)
     if not handler:
         logger.warning(f"Unknown method: {method}")
         return create_error(request_id, -32601, f"Method not found: {method}")
 
     try:
-        result = handler(params)
+        result = await handler(params)
 
         # Check for error in result
-        if "error" in result and isinstance(result["error"], str):
+        if isinstance(result, dict) and isinstance(result.get("error"), str):
             return create_error(request_id, -32000, result["error"])
 
         return create_response(request_id, result)
@@ -237,16 +499,45 @@ def process_request(request: Dict) -> Optional[Dict]:
 # HTTP SERVER (for Glama.ai inspection)
 # ═══════════════════════════════════════════════════════════════════════════
 
+class AsyncLoopThread:
+    """Event loop running in a background thread.
+
+    Lets the threaded HTTP server submit coroutines to one long-lived loop,
+    so every request shares the same pooled async HTTP client.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="vap-mcp-loop", daemon=True
+        )
+
+    def start(self):
+        """Start the loop thread."""
+        self._thread.start()
+
+    def run(self, coro):
+        """Run a coroutine on the loop and block until it completes."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def stop(self):
+        """Close the shared HTTP client and stop the loop."""
+        self.run(close_http_client())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
 class MCPHTTPHandler(BaseHTTPRequestHandler):
     """HTTP handler for MCP JSON-RPC requests."""
 
     def log_message(self, format, *args):
         """Route HTTP server logs to our logger."""
-        logger.debug(f"HTTP: {format % args}")
+        if _DEBUG:
+            logger.debug("HTTP: %s", format % args)
 
     def _send_json_response(self, data: Dict, status: int = 200):
         """Send JSON response with CORS headers."""
-        response_bytes = json.dumps(data).encode('utf-8')
+        response_bytes = encode_response(data)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', len(response_bytes))
@@ -280,6 +571,15 @@ class MCPHTTPHandler(BaseHTTPRequestHandler):
         """Handle MCP JSON-RPC requests."""
         try:
             content_length = int(self.headers.get('Content-Length', 0))
+            if content_length > MAX_FRAME_BYTES:
+                logger.warning(f"Rejected request larger than {MAX_FRAME_BYTES} bytes")
+                self.close_connection = True
+                self._send_json_response(
+                    create_error(None, -32600, "Request too large"),
+                    413
+                )
+                return
+
             body = self.rfile.read(content_length).decode('utf-8')
 
             if not body:
@@ -289,10 +589,11 @@ class MCPHTTPHandler(BaseHTTPRequestHandler):
                 )
                 return
 
-            logger.debug(f"HTTP Request: {body[:500]}...")
+            if _DEBUG:
+                logger.debug("HTTP Request: %s...", body[:500])
 
-            request = json.loads(body)
-            response = process_request(request)
+            request = _loads(body)
+            response = self.server.loop_thread.run(process_request(request))
 
             if response is None:
                 # Notification - return empty success
@@ -317,48 +618,163 @@ class MCPHTTPHandler(BaseHTTPRequestHandler):
 def run_http_server(port: int):
     """Run HTTP server for MCP requests."""
     server_address = ('', port)
-    httpd = HTTPServer(server_address, MCPHTTPHandler)
+    httpd = ThreadingHTTPServer(server_address, MCPHTTPHandler)
+    httpd.loop_thread = AsyncLoopThread()
+    httpd.loop_thread.start()
     logger.info(f"VAP MCP HTTP Server listening on port {port}")
     logger.info(f"Endpoints: POST / (JSON-RPC), GET /health")
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         logger.info("Shutting down HTTP server...")
-        httpd.shutdown()
+    finally:
+        httpd.server_close()
+        httpd.loop_thread.stop()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # STDIO MODE (for Claude Desktop)
 # ═══════════════════════════════════════════════════════════════════════════
 
-def run_stdio():
-    """Run stdio loop for Claude Desktop."""
-    logger.info("VAP MCP Proxy starting in stdio mode...")
+def _write_frame(frame: bytes):
+    """Write one newline-terminated JSON-RPC frame to stdout."""
+    out = sys.stdout.buffer
+    out.write(frame)
+    out.write(b"\n")
+    out.flush()
 
-    # Read line by line from stdin
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
 
-        logger.debug(f"Received: {line[:200]}...")
+async def _handle_stdio_request(request: Dict):
+    """Process one request and write its response to stdout."""
+    try:
+        response = await process_request(request)
 
+        # Send response only for requests (not notifications). Writes happen
+        # synchronously on the loop thread, so frames never interleave.
+        if response is not None:
+            frame = encode_response(response)
+            if _DEBUG:
+                logger.debug("Sending: %s...", frame[:200].decode('utf-8', 'replace'))
+            _write_frame(frame)
+    except Exception as e:
+        # Runs as a detached task: nothing else would report this, and the
+        # client would wait forever for its reply
+        logger.error(f"Failed to answer request: {e}", exc_info=True)
+        request_id = request.get("id")
+        if request_id is None:
+            return
         try:
-            request = json.loads(line)
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON: {e}")
-            response = create_error(None, -32700, "Parse error")
-            print(json.dumps(response), flush=True)
-            continue
+            _write_frame(_dumps(create_error(request_id, -32603, f"Internal error: {e}")))
+        except Exception:
+            logger.error("Failed to write error response", exc_info=True)
 
-        # Process request
-        response = process_request(request)
 
-        # Send response only for requests (not notifications)
-        if response is not None:
-            response_json = json.dumps(response)
-            logger.debug(f"Sending: {response_json[:200]}...")
-            print(response_json, flush=True)
+# Queued in place of a line longer than MAX_FRAME_BYTES
+_OVERSIZED = object()
+
+
+def _read_stdin(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+    """Blocking stdin reader, run in a daemon thread.
+
+    Hands each line to the event loop as it arrives; None marks EOF.
+    MCP frames are UTF-8 JSON terminated by \n, so lines are read as raw
+    bytes with no text-mode decoding or newline translation. Reads go
+    straight to the file descriptor: a daemon thread blocked inside
+    sys.stdin.buffer would hold its lock and abort interpreter shutdown.
+
+    Oversized lines are dropped as they stream in, so buffered input never
+    grows much past MAX_FRAME_BYTES.
+    """
+    fd = sys.stdin.fileno()
+    pending = b""
+    skipping = False  # discarding the rest of an oversized line
+    try:
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                if skipping:
+                    skipping = False
+                elif len(line) > MAX_FRAME_BYTES:
+                    loop.call_soon_threadsafe(queue.put_nowait, _OVERSIZED)
+                else:
+                    loop.call_soon_threadsafe(queue.put_nowait, line)
+            if len(pending) > MAX_FRAME_BYTES:
+                if not skipping:
+                    loop.call_soon_threadsafe(queue.put_nowait, _OVERSIZED)
+                skipping = True
+                pending = b""
+        if pending and not skipping:
+            loop.call_soon_threadsafe(queue.put_nowait, pending)
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+    except RuntimeError:
+        # Event loop already closed during shutdown
+        pass
+
+
+async def _serve_stdio():
+    """Read stdin line by line and dispatch each request as its own task."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    pending = set()
+
+    # A dedicated daemon thread owns the blocking read, so the loop keeps
+    # running tool calls while the next frame is read, and an interrupted
+    # proxy never waits on a read stuck in an executor thread.
+    threading.Thread(
+        target=_read_stdin, args=(loop, queue), name="vap-mcp-stdin", daemon=True
+    ).start()
+
+    try:
+        while True:
+            # Both JSON parsers accept bytes directly
+            line = await queue.get()
+            if line is None:
+                break
+            if line is _OVERSIZED:
+                logger.warning(f"Rejected request larger than {MAX_FRAME_BYTES} bytes")
+                _write_frame(_dumps(create_error(None, -32600, "Request too large")))
+                continue
+
+            if _DEBUG:
+                logger.debug("Received: %s...", line[:200].decode('utf-8', 'replace'))
+
+            # Cheap shape check: a JSON-RPC request is a JSON object, so
+            # anything else is rejected without running the parser
+            if line[:1] != b"{":
+                if not line or line.isspace():
+                    continue
+                logger.error("Invalid JSON: request is not a JSON object")
+                _write_frame(_dumps(create_error(None, -32700, "Parse error")))
+                continue
+
+            try:
+                request = _loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON: {e}")
+                response = create_error(None, -32700, "Parse error")
+                _write_frame(_dumps(response))
+                continue
+
+            # Keep reading while the request runs so slow tool calls
+            # (e.g. generate_video) don't block the ones behind them.
+            task = asyncio.create_task(_handle_stdio_request(request))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        # stdin closed - let in-flight requests finish
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        await close_http_client()
+
+
+def run_stdio():
+    """Run stdio loop for Claude Desktop."""
+    logger.info("VAP MCP Proxy starting in stdio mode...")
+    asyncio.run(_serve_stdio())
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -6,8 +6,9 @@ Official Python client for VAP AI Image Generation API
 __version__ = "1.0.0"
 __author__ = "VAP Team"
 
-from .client import VAPEClient
-from .async_client import AsyncVAPEClient
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .models import (
     GenerateResult,
     UpscaleResult,
@@ -36,12 +37,37 @@ from .webhooks import (
     WEBHOOK_EVENTS,
 )
 
+if TYPE_CHECKING:
+    from .client import VAPEClient
+    from .async_client import AsyncVAPEClient
+    from ._pool import get_shared_client, close_shared_clients
+
+# The clients import httpx; load them on first use so that importing the
+# package for models or webhook verification stays cheap.
+_LAZY = {
+    "VAPEClient": ".client",
+    "AsyncVAPEClient": ".async_client",
+    "get_shared_client": "._pool",
+    "close_shared_clients": "._pool",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     # Version
     "__version__",
     # Clients
     "VAPEClient",
     "AsyncVAPEClient",
+    "get_shared_client",
+    "close_shared_clients",
     # Models
     "GenerateResult",
     "UpscaleResult",
@@ -0,0 +1,47 @@
+"""
+VAP JSON Helpers
+JSON encoding with orjson when installed, canonical encoding for signatures
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def canonical_dumps(obj) -> str:
+    """
+    Serialize obj the way VAP signs webhook payloads.
+
+    Always the stdlib encoder: orjson writes non-ASCII characters and some
+    floats differently, which would change the signed bytes.
+    """
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True)
+
+
+if orjson is not None:
+    def loads(data):
+        """Parse JSON from str or bytes."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN/Infinity and integers over 64 bits
+            return json.loads(data)
+else:
+    loads = json.loads
+
+
+if orjson is not None:
+    def dumps(obj) -> bytes:
+        """Serialize a request body to UTF-8 JSON bytes."""
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. non-str dict keys, which the stdlib encoder coerces
+            return json.dumps(obj).encode("utf-8")
+else:
+    def dumps(obj) -> bytes:
+        """Serialize a request body to UTF-8 JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
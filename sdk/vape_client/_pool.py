@@ -0,0 +1,78 @@
+"""
+VAP Shared Clients
+Process-wide AsyncVAPEClient instances, one per event loop and API key
+"""
+
+import asyncio
+import atexit
+from typing import Dict, Tuple
+from weakref import WeakKeyDictionary
+
+from .async_client import AsyncVAPEClient
+
+# loop -> {(api_key, base_url): client}. An httpx pool is bound to the loop
+# that created it, so clients are never shared across event loops.
+_CLIENTS: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], AsyncVAPEClient]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_shared_client(api_key: str, base_url: str = None, **kwargs) -> AsyncVAPEClient:
+    """
+    Get the shared async client for an API key on the running event loop.
+
+    Short-lived callers (web handlers, background jobs) should use this
+    instead of creating an AsyncVAPEClient per call, so the connection
+    pool and its keep-alive connections are reused. Leaving an
+    ``async with`` block does not close a shared client.
+
+    Args:
+        api_key: Your VAP API key
+        base_url: API base URL (default: AsyncVAPEClient.DEFAULT_BASE_URL)
+        **kwargs: Extra AsyncVAPEClient options, used only when the
+            client is first created
+
+    Returns:
+        AsyncVAPEClient shared by all callers on this event loop
+
+    Example:
+        async def handler():
+            client = get_shared_client("vape_xxx...")
+            return await client.get_task(task_id)
+    """
+    # Forget clients of loops that have since been closed (asyncio.run per job)
+    for stale in [loop for loop in _CLIENTS if loop.is_closed()]:
+        del _CLIENTS[stale]
+
+    loop = asyncio.get_running_loop()
+
+    clients = _CLIENTS.get(loop)
+    if clients is None:
+        clients = _CLIENTS[loop] = {}
+
+    key = (api_key, (base_url or AsyncVAPEClient.DEFAULT_BASE_URL).rstrip("/"))
+    client = clients.get(key)
+    if client is None:
+        client = AsyncVAPEClient(api_key=api_key, base_url=base_url, **kwargs)
+        client._shared = True
+        clients[key] = client
+    return client
+
+
+async def close_shared_clients():
+    """Close all shared clients bound to the running event loop."""
+    clients = _CLIENTS.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def _close_at_exit():
+    """Close shared clients whose event loop can still run them."""
+    for loop, clients in list(_CLIENTS.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+        for client in clients.values():
+            loop.run_until_complete(client.close())
+
+
+atexit.register(_close_at_exit)
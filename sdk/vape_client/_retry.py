@@ -0,0 +1,52 @@
+"""
+VAP Retry Policy
+Backoff schedule and retriable errors shared by both clients
+"""
+
+import random
+
+import httpx
+
+from .exceptions import (
+    VAPEServerError,
+    VAPERateLimitError,
+    VAPEConnectionError,
+    VAPETimeoutError,
+)
+
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+# Longer server-requested waits are raised to the caller instead of slept on
+MAX_RETRY_AFTER = 60.0
+
+# Failures worth another attempt; anything else is raised immediately
+RETRIABLE = (httpx.TimeoutException, httpx.ConnectError, VAPEServerError, VAPERateLimitError)
+
+
+def backoff_schedule(max_retries: int):
+    """Yield the delay before each of max_retries retries (jittered exponential)."""
+    for attempt in range(max_retries):
+        yield min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * (0.5 + random.random())
+
+
+def next_delay(error: Exception, schedule) -> float:
+    """
+    Seconds to wait before retrying after error.
+
+    Raises instead once the schedule is exhausted, or when a 429 asks for a
+    longer wait than MAX_RETRY_AFTER. Transport errors are raised as
+    VAPETimeoutError / VAPEConnectionError.
+    """
+    delay = next(schedule, None)
+    if delay is None:
+        if isinstance(error, httpx.TimeoutException):
+            raise VAPETimeoutError(f"Request timed out: {error}") from error
+        if isinstance(error, httpx.ConnectError):
+            raise VAPEConnectionError(f"Connection failed: {error}") from error
+        raise error
+
+    if isinstance(error, VAPERateLimitError) and error.retry_after is not None:
+        delay = float(error.retry_after)
+        if delay > MAX_RETRY_AFTER:
+            raise error
+    return delay
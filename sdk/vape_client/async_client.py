@@ -3,8 +3,15 @@ VAP Async Client
 Asynchronous HTTP client for VAP API
 """
 
+import asyncio
+import time
 import httpx
-from typing import Optional, List, Dict, Any
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, AsyncIterator
+from . import __version__
+from ._json import dumps, loads
+from ._retry import RETRIABLE, backoff_schedule, next_delay
 from .models import (
     GenerateResult,
     UpscaleResult,
@@ -15,18 +22,50 @@ from .models import (
     MusicResult,
     TaskResult,
     TaskListResult,
+    from_json,
 )
 from .exceptions import (
-    VAPEError,
-    VAPEAuthenticationError,
-    VAPEInsufficientBalanceError,
     VAPERateLimitError,
     VAPEValidationError,
-    VAPEServerError,
-    VAPEConnectionError,
     VAPETimeoutError,
+    error_for_status,
 )
 
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+# Optional aiohttp-backed transport (pip install httpx-aiohttp)
+_AIOHTTP_AVAILABLE = find_spec("httpx_aiohttp") is not None
+
+# Incremental JSON parsing for list_tasks_stream (pip install ijson)
+_IJSON_AVAILABLE = find_spec("ijson") is not None
+
+# API endpoints
+_HEALTH_URL = "/v3/health"
+_GENERATE_URL = "/v3/generate"
+_UPSCALE_URL = "/v3/upscale"
+_VALIDATE_URL = "/v3/validate"
+_BALANCE_URL = "/v3/balance"
+_TASKS_URL = "/v3/tasks"
+_TASK_URL = "/v3/tasks/"  # + task_id
+
+# Task states after which polling stops
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+
+class _ByteStreamReader:
+    """Async file-like view of an async byte iterator, as ijson expects."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, n: int = -1) -> bytes:
+        if n == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
 
 class AsyncVAPEClient:
     """
@@ -36,6 +75,10 @@ class AsyncVAPEClient:
         async with AsyncVAPEClient(api_key="vape_xxx...") as client:
             result = await client.generate(description="A sunset")
             print(result.image_url)
+
+    Calls such as generate, get_task and list_tasks may be issued
+    concurrently with asyncio.gather. With HTTP/2 they are multiplexed
+    over a single connection instead of waiting for pool slots.
     """
 
     DEFAULT_BASE_URL = "https://api.vapagent.com"
@@ -47,6 +90,10 @@ class AsyncVAPEClient:
         base_url: str = None,
         timeout: float = None,
         max_retries: int = 3,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        http2: bool = True,
+        use_aiohttp: bool = False,
     ):
         """
         Initialize async VAP client.
@@ -55,82 +102,70 @@ class AsyncVAPEClient:
             api_key: Your VAP API key (starts with vape_)
             base_url: API base URL (default: http://localhost:8000)
             timeout: Request timeout in seconds (default: 60)
-            max_retries: Max retry attempts for transient errors (default: 3)
+            max_retries: Max retries after the first attempt for transient errors (default: 3)
+            max_connections: Max concurrent connections in the pool (default: 1000)
+            max_keepalive_connections: Max idle connections kept open for reuse (default: 100).
+                With HTTP/2 one connection carries many requests, so ~10 is usually plenty.
+            http2: Use HTTP/2 when the h2 package is installed (default: True)
+            use_aiohttp: Send requests through aiohttp when httpx-aiohttp is installed
+                (default: False). Faster for large fan-outs over HTTP/1.1; disables HTTP/2.
         """
         self.api_key = api_key
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.max_retries = max_retries
-        self._client: Optional[httpx.AsyncClient] = None
-
-    def _default_headers(self) -> Dict[str, str]:
-        """Get default request headers."""
-        return {
-            "Authorization": f"Bearer {self.api_key}",
+        self._headers = MappingProxyType({
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
-            "User-Agent": "vap-client-python/1.0.0",
-        }
+            "User-Agent": f"vap-client-python/{__version__}",
+        })
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2
+        self.use_aiohttp = use_aiohttp
+        self._client: Optional[httpx.AsyncClient] = None
+        # Set by get_shared_client; shared clients outlive `async with` blocks
+        self._shared = False
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client."""
         if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=30.0,
+            )
+            transport = None
+            if self.use_aiohttp and _AIOHTTP_AVAILABLE:
+                from httpx_aiohttp import AiohttpTransport
+                transport = AiohttpTransport(limits=limits)
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
                 timeout=self.timeout,
-                headers=self._default_headers(),
+                headers=self._headers,
+                limits=limits,
+                http2=self.http2 and _HTTP2_AVAILABLE,
+                transport=transport,
             )
         return self._client
 
-    def _handle_response(self, response: httpx.Response) -> dict:
-        """Handle API response and raise appropriate exceptions."""
+    def _handle_response(self, response: httpx.Response, model: type = None):
+        """
+        Handle API response and raise appropriate exceptions.
+
+        Returns the decoded body, or an instance of model when one is given.
+        """
+        status = response.status_code
         try:
-            data = response.json()
-        except:
+            if status == 200 and model is not None:
+                return from_json(model, response.content)
+            data = loads(response.content)
+        except ValueError:
             data = {"error": response.text}
 
-        if response.status_code == 200:
-            return data
-        elif response.status_code == 401:
-            raise VAPEAuthenticationError(
-                message=data.get("error", "Authentication failed"),
-                status_code=401,
-                response=data,
-            )
-        elif response.status_code == 402:
-            raise VAPEInsufficientBalanceError(
-                message=data.get("error", "Insufficient balance"),
-                status_code=402,
-                response=data,
-                balance=data.get("balance"),
-                required=data.get("required"),
-            )
-        elif response.status_code == 429:
-            raise VAPERateLimitError(
-                message=data.get("error", "Rate limit exceeded"),
-                status_code=429,
-                response=data,
-                retry_after=data.get("retry_after"),
-                limit_type=data.get("limit_type"),
-            )
-        elif response.status_code == 400:
-            raise VAPEValidationError(
-                message=data.get("error", "Validation error"),
-                status_code=400,
-                response=data,
-                errors=data.get("errors"),
-            )
-        elif response.status_code >= 500:
-            raise VAPEServerError(
-                message=data.get("error", "Server error"),
-                status_code=response.status_code,
-                response=data,
-            )
-        else:
-            raise VAPEError(
-                message=data.get("error", f"Request failed with status {response.status_code}"),
-                status_code=response.status_code,
-                response=data,
-            )
+        if status == 200:
+            return data if model is None else model.from_response(data)
+        raise error_for_status(status, data)
 
     async def _request(
         self,
@@ -138,47 +173,31 @@ class AsyncVAPEClient:
         endpoint: str,
         json: dict = None,
         params: dict = None,
-    ) -> dict:
-        """Make async HTTP request with retry logic."""
+        model: type = None,
+    ):
+        """
+        Make async HTTP request with retry logic.
+
+        Timeouts, connection failures and 5xx responses are retried up to
+        max_retries times with jittered exponential backoff. A 429 waits
+        for the server's retry_after when it is reasonably short. Other
+        API errors are raised immediately.
+        """
         client = await self._get_client()
-        last_error = None
+        schedule = backoff_schedule(self.max_retries)
 
-        for attempt in range(self.max_retries):
+        while True:
             try:
                 response = await client.request(
                     method=method,
                     url=endpoint,
-                    json=json,
+                    content=None if json is None else dumps(json),
                     params=params,
                 )
-                return self._handle_response(response)
-
-            except httpx.TimeoutException as e:
-                last_error = VAPETimeoutError(f"Request timed out: {e}")
-                if attempt < self.max_retries - 1:
-                    continue
-
-            except httpx.ConnectError as e:
-                last_error = VAPEConnectionError(f"Connection failed: {e}")
-                if attempt < self.max_retries - 1:
-                    continue
-
-            except (VAPEAuthenticationError, VAPEInsufficientBalanceError,
-                    VAPEValidationError) as e:
-                raise
-
-            except VAPERateLimitError as e:
-                raise
+                return self._handle_response(response, model)
 
-            except VAPEServerError as e:
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    continue
-
-            except VAPEError:
-                raise
-
-        raise last_error
+            except RETRIABLE as e:
+                await asyncio.sleep(next_delay(e, schedule))
 
     async def close(self):
         """Close the async HTTP client."""
@@ -190,7 +209,8 @@ class AsyncVAPEClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.close()
+        if not self._shared:
+            await self.close()
 
     # ============================================
     # API Methods
@@ -198,8 +218,7 @@ class AsyncVAPEClient:
 
     async def health(self) -> HealthStatus:
         """Check API health status."""
-        data = await self._request("GET", "/v3/health")
-        return HealthStatus.from_response(data)
+        return await self._request("GET", _HEALTH_URL, model=HealthStatus)
 
     async def generate(
         self,
@@ -222,8 +241,7 @@ class AsyncVAPEClient:
         if metadata:
             payload["metadata"] = metadata
 
-        data = await self._request("POST", "/v3/generate", json=payload)
-        return GenerateResult.from_response(data)
+        return await self._request("POST", _GENERATE_URL, json=payload, model=GenerateResult)
 
     async def upscale(
         self,
@@ -241,8 +259,7 @@ class AsyncVAPEClient:
         if image_base64:
             payload["image_base64"] = image_base64
 
-        data = await self._request("POST", "/v3/upscale", json=payload)
-        return UpscaleResult.from_response(data)
+        return await self._request("POST", _UPSCALE_URL, json=payload, model=UpscaleResult)
 
     async def validate(
         self,
@@ -262,12 +279,12 @@ class AsyncVAPEClient:
         if checks:
             payload["checks"] = checks
 
-        data = await self._request("POST", "/v3/validate", json=payload)
+        data = await self._request("POST", _VALIDATE_URL, json=payload)
         return ValidateResult.from_response(data)
 
     async def get_balance(self) -> Balance:
         """Get current account balance."""
-        data = await self._request("GET", "/v3/balance")
+        data = await self._request("GET", _BALANCE_URL)
         return Balance.from_response(data)
 
     # ============================================
@@ -311,7 +328,7 @@ class AsyncVAPEClient:
         if negative_prompt:
             payload["params"]["negative_prompt"] = negative_prompt
 
-        data = await self._request("POST", "/v3/tasks", json=payload)
+        data = await self._request("POST", _TASKS_URL, json=payload)
         return VideoResult.from_response(data)
 
     # ============================================
@@ -350,7 +367,7 @@ class AsyncVAPEClient:
             }
         }
 
-        data = await self._request("POST", "/v3/tasks", json=payload)
+        data = await self._request("POST", _TASKS_URL, json=payload)
         return MusicResult.from_response(data)
 
     # ============================================
@@ -367,9 +384,57 @@ class AsyncVAPEClient:
         Returns:
             TaskResult with status and result_url when completed
         """
-        data = await self._request("GET", f"/v3/tasks/{task_id}")
+        data = await self._request("GET", _TASK_URL + str(task_id))
         return TaskResult.from_response(data)
 
+    async def poll_until_complete(
+        self,
+        task_id: str,
+        max_wait: float = 600.0,
+        initial_delay: float = 0.5,
+        max_delay: float = 15.0,
+    ) -> TaskResult:
+        """
+        Wait for a task to finish, polling less often the longer it runs.
+
+        The interval starts at initial_delay and grows 1.6x per poll up to
+        max_delay. If polling is rate limited, the server's retry_after is
+        used instead.
+
+        Args:
+            task_id: Task UUID from generate_image/video/music
+            max_wait: Give up after this many seconds (default: 600)
+            initial_delay: First polling interval in seconds (default: 0.5)
+            max_delay: Longest polling interval in seconds (default: 15)
+
+        Returns:
+            TaskResult with status completed, failed or cancelled
+
+        Raises:
+            VAPETimeoutError: The task did not finish within max_wait
+        """
+        deadline = time.monotonic() + max_wait
+        delay = initial_delay
+
+        while True:
+            wait = delay
+            try:
+                task = await self.get_task(task_id)
+            except VAPERateLimitError as e:
+                if e.retry_after is not None:
+                    wait = float(e.retry_after)
+                if time.monotonic() + wait > deadline:
+                    raise
+            else:
+                if task.status in _TERMINAL_STATUSES:
+                    return task
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise VAPETimeoutError(f"Task {task_id} did not finish within {max_wait}s")
+            await asyncio.sleep(min(wait, remaining))
+            delay = min(max_delay, delay * 1.6)
+
     async def list_tasks(
         self,
         status: Optional[str] = None,
@@ -389,5 +454,121 @@ class AsyncVAPEClient:
         if status:
             params["status"] = status
 
-        data = await self._request("GET", "/v3/tasks", params=params)
-        return TaskListResult.from_response(data)
\ No newline at end of file
+        data = await self._request("GET", _TASKS_URL, params=params)
+        return TaskListResult.from_response(data)
+
+    async def list_tasks_stream(
+        self,
+        status: Optional[str] = None,
+        limit: int = 10,
+    ) -> AsyncIterator[TaskResult]:
+        """
+        Iterate over recent generation tasks as the response arrives.
+
+        With ijson installed, tasks are parsed incrementally from the
+        response stream instead of buffering the whole listing first.
+        Without it this falls back to list_tasks. The request is not retried.
+
+        Args:
+            status: Filter by status (pending, processing, completed, failed)
+            limit: Maximum number of tasks to return (1-50)
+
+        Yields:
+            TaskResult for each task
+        """
+        if not _IJSON_AVAILABLE:
+            for task in (await self.list_tasks(status=status, limit=limit)).tasks:
+                yield task
+            return
+
+        import ijson
+
+        params = {"limit": limit}
+        if status:
+            params["status"] = status
+
+        client = await self._get_client()
+        async with client.stream("GET", _TASKS_URL, params=params) as response:
+            if response.status_code != 200:
+                await response.aread()
+                self._handle_response(response)
+
+            reader = _ByteStreamReader(response.aiter_bytes())
+            async for item in ijson.items_async(reader, "tasks.item", use_float=True):
+                yield TaskResult.from_response(item)
+
+    # ============================================
+    # Batch Operations
+    # ============================================
+
+    async def _gather(
+        self,
+        call,
+        args: List[Any],
+        concurrency: Optional[int],
+        return_exceptions: bool,
+    ) -> list:
+        """Run call(arg) for every arg with at most `concurrency` in flight."""
+        sem = asyncio.Semaphore(concurrency or self.max_keepalive_connections)
+
+        async def _one(arg):
+            async with sem:
+                return await call(arg)
+
+        return await asyncio.gather(
+            *(_one(arg) for arg in args),
+            return_exceptions=return_exceptions,
+        )
+
+    async def generate_many(
+        self,
+        requests: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = True,
+    ) -> List[GenerateResult]:
+        """
+        Generate several images concurrently.
+
+        Args:
+            requests: generate() keyword arguments, one dict per image
+            concurrency: Max requests in flight (default: max_keepalive_connections)
+            return_exceptions: Return failures in place of results instead of
+                raising the first one (default: True)
+
+        Returns:
+            Results in the same order as requests
+        """
+        return await self._gather(
+            lambda req: self.generate(**req), requests, concurrency, return_exceptions
+        )
+
+    async def upscale_many(
+        self,
+        requests: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = True,
+    ) -> List[UpscaleResult]:
+        """Upscale several images concurrently. See generate_many."""
+        return await self._gather(
+            lambda req: self.upscale(**req), requests, concurrency, return_exceptions
+        )
+
+    async def validate_many(
+        self,
+        requests: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = True,
+    ) -> List[ValidateResult]:
+        """Validate several images concurrently. See generate_many."""
+        return await self._gather(
+            lambda req: self.validate(**req), requests, concurrency, return_exceptions
+        )
+
+    async def get_tasks(
+        self,
+        task_ids: List[str],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = True,
+    ) -> List[TaskResult]:
+        """Get several tasks by id concurrently. See generate_many."""
+        return await self._gather(self.get_task, task_ids, concurrency, return_exceptions)
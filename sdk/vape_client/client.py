@@ -3,8 +3,13 @@ VAP Sync Client
 Synchronous HTTP client for VAP API
 """
 
+import time
 import httpx
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any
+from . import __version__
+from ._json import dumps, loads
+from ._retry import RETRIABLE, backoff_schedule, next_delay
 from .models import (
     GenerateResult,
     UpscaleResult,
@@ -15,19 +20,24 @@ from .models import (
     MusicResult,
     TaskResult,
     TaskListResult,
+    from_json,
 )
 from .exceptions import (
-    VAPEError,
-    VAPEAuthenticationError,
-    VAPEInsufficientBalanceError,
-    VAPERateLimitError,
     VAPEValidationError,
-    VAPEServerError,
-    VAPEConnectionError,
-    VAPETimeoutError,
+    error_for_status,
 )
 
 
+# API endpoints
+_HEALTH_URL = "/v3/health"
+_GENERATE_URL = "/v3/generate"
+_UPSCALE_URL = "/v3/upscale"
+_VALIDATE_URL = "/v3/validate"
+_BALANCE_URL = "/v3/balance"
+_TASKS_URL = "/v3/tasks"
+_TASK_URL = "/v3/tasks/"  # + task_id
+
+
 class VAPEClient:
     """
     Synchronous client for VAP API.
@@ -55,77 +65,41 @@ class VAPEClient:
             api_key: Your VAP API key (starts with vape_)
             base_url: API base URL (default: http://localhost:8000)
             timeout: Request timeout in seconds (default: 60)
-            max_retries: Max retry attempts for transient errors (default: 3)
+            max_retries: Max retries after the first attempt for transient errors (default: 3)
         """
         self.api_key = api_key
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.max_retries = max_retries
+        self._headers = MappingProxyType({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": f"vap-client-python/{__version__}",
+        })
 
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=self.timeout,
-            headers=self._default_headers(),
+            headers=self._headers,
         )
 
-    def _default_headers(self) -> Dict[str, str]:
-        """Get default request headers."""
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "vap-client-python/1.0.0",
-        }
+    def _handle_response(self, response: httpx.Response, model: type = None):
+        """
+        Handle API response and raise appropriate exceptions.
 
-    def _handle_response(self, response: httpx.Response) -> dict:
-        """Handle API response and raise appropriate exceptions."""
+        Returns the decoded body, or an instance of model when one is given.
+        """
+        status = response.status_code
         try:
-            data = response.json()
-        except:
+            if status == 200 and model is not None:
+                return from_json(model, response.content)
+            data = loads(response.content)
+        except ValueError:
             data = {"error": response.text}
 
-        if response.status_code == 200:
-            return data
-        elif response.status_code == 401:
-            raise VAPEAuthenticationError(
-                message=data.get("error", "Authentication failed"),
-                status_code=401,
-                response=data,
-            )
-        elif response.status_code == 402:
-            raise VAPEInsufficientBalanceError(
-                message=data.get("error", "Insufficient balance"),
-                status_code=402,
-                response=data,
-                balance=data.get("balance"),
-                required=data.get("required"),
-            )
-        elif response.status_code == 429:
-            raise VAPERateLimitError(
-                message=data.get("error", "Rate limit exceeded"),
-                status_code=429,
-                response=data,
-                retry_after=data.get("retry_after"),
-                limit_type=data.get("limit_type"),
-            )
-        elif response.status_code == 400:
-            raise VAPEValidationError(
-                message=data.get("error", "Validation error"),
-                status_code=400,
-                response=data,
-                errors=data.get("errors"),
-            )
-        elif response.status_code >= 500:
-            raise VAPEServerError(
-                message=data.get("error", "Server error"),
-                status_code=response.status_code,
-                response=data,
-            )
-        else:
-            raise VAPEError(
-                message=data.get("error", f"Request failed with status {response.status_code}"),
-                status_code=response.status_code,
-                response=data,
-            )
+        if status == 200:
+            return data if model is None else model.from_response(data)
+        raise error_for_status(status, data)
 
     def _request(
         self,
@@ -133,49 +107,31 @@ class VAPEClient:
         endpoint: str,
         json: dict = None,
         params: dict = None,
-    ) -> dict:
-        """Make HTTP request with retry logic."""
+        model: type = None,
+    ):
+        """
+        Make HTTP request with retry logic.
+
+        Timeouts, connection failures and 5xx responses are retried up to
+        max_retries times with jittered exponential backoff. A 429 waits
+        for the server's retry_after when it is reasonably short. Other
+        API errors are raised immediately.
+        """
         url = endpoint if endpoint.startswith("http") else endpoint
-        last_error = None
+        schedule = backoff_schedule(self.max_retries)
 
-        for attempt in range(self.max_retries):
+        while True:
             try:
                 response = self._client.request(
                     method=method,
                     url=url,
-                    json=json,
+                    content=None if json is None else dumps(json),
                     params=params,
                 )
-                return self._handle_response(response)
-
-            except httpx.TimeoutException as e:
-                last_error = VAPETimeoutError(f"Request timed out: {e}")
-                if attempt < self.max_retries - 1:
-                    continue
-
-            except httpx.ConnectError as e:
-                last_error = VAPEConnectionError(f"Connection failed: {e}")
-                if attempt < self.max_retries - 1:
-                    continue
-
-            except (VAPEAuthenticationError, VAPEInsufficientBalanceError,
-                    VAPEValidationError) as e:
-                # Don't retry these errors
-                raise
-
-            except VAPERateLimitError as e:
-                # Don't retry rate limit errors
-                raise
-
-            except VAPEServerError as e:
-                last_error = e
-                if attempt < self.max_retries - 1:
-                    continue
-
-            except VAPEError:
-                raise
+                return self._handle_response(response, model)
 
-        raise last_error
+            except RETRIABLE as e:
+                time.sleep(next_delay(e, schedule))
 
     def close(self):
         """Close the HTTP client."""
@@ -198,8 +154,7 @@ class VAPEClient:
         Returns:
             HealthStatus object
         """
-        data = self._request("GET", "/v3/health")
-        return HealthStatus.from_response(data)
+        return self._request("GET", _HEALTH_URL, model=HealthStatus)
 
     def generate(
         self,
@@ -234,8 +189,7 @@ class VAPEClient:
         if metadata:
             payload["metadata"] = metadata
 
-        data = self._request("POST", "/v3/generate", json=payload)
-        return GenerateResult.from_response(data)
+        return self._request("POST", _GENERATE_URL, json=payload, model=GenerateResult)
 
     def upscale(
         self,
@@ -263,8 +217,7 @@ class VAPEClient:
         if image_base64:
             payload["image_base64"] = image_base64
 
-        data = self._request("POST", "/v3/upscale", json=payload)
-        return UpscaleResult.from_response(data)
+        return self._request("POST", _UPSCALE_URL, json=payload, model=UpscaleResult)
 
     def validate(
         self,
@@ -294,7 +247,7 @@ class VAPEClient:
         if checks:
             payload["checks"] = checks
 
-        data = self._request("POST", "/v3/validate", json=payload)
+        data = self._request("POST", _VALIDATE_URL, json=payload)
         return ValidateResult.from_response(data)
 
     def get_balance(self) -> Balance:
@@ -304,7 +257,7 @@ class VAPEClient:
         Returns:
             Balance object with current balance
         """
-        data = self._request("GET", "/v3/balance")
+        data = self._request("GET", _BALANCE_URL)
         return Balance.from_response(data)
 
     # ============================================
@@ -348,7 +301,7 @@ class VAPEClient:
         if negative_prompt:
             payload["params"]["negative_prompt"] = negative_prompt
 
-        data = self._request("POST", "/v3/tasks", json=payload)
+        data = self._request("POST", _TASKS_URL, json=payload)
         return VideoResult.from_response(data)
 
     # ============================================
@@ -387,7 +340,7 @@ class VAPEClient:
             }
         }
 
-        data = self._request("POST", "/v3/tasks", json=payload)
+        data = self._request("POST", _TASKS_URL, json=payload)
         return MusicResult.from_response(data)
 
     # ============================================
@@ -404,7 +357,7 @@ class VAPEClient:
         Returns:
             TaskResult with status and result_url when completed
         """
-        data = self._request("GET", f"/v3/tasks/{task_id}")
+        data = self._request("GET", _TASK_URL + str(task_id))
         return TaskResult.from_response(data)
 
     def list_tasks(
@@ -426,5 +379,5 @@ class VAPEClient:
         if status:
             params["status"] = status
 
-        data = self._request("GET", "/v3/tasks", params=params)
+        data = self._request("GET", _TASKS_URL, params=params)
         return TaskListResult.from_response(data)
\ No newline at end of file
@@ -3,6 +3,8 @@ VAP SDK Exceptions
 Hierarchical exception classes for error handling
 """
 
+from types import MappingProxyType
+
 
 class VAPEError(Exception):
     """Base exception for all VAP errors."""
@@ -62,4 +64,71 @@ class VAPEConnectionError(VAPEError):
 
 class VAPETimeoutError(VAPEError):
     """Raised when request times out."""
-    pass
\ No newline at end of file
+    pass
+
+
+# ============================================
+# Status code dispatch
+# ============================================
+
+def _authentication_error(data: dict, status: int) -> VAPEError:
+    return VAPEAuthenticationError(
+        message=data.get("error", "Authentication failed"),
+        status_code=status,
+        response=data,
+    )
+
+
+def _insufficient_balance_error(data: dict, status: int) -> VAPEError:
+    return VAPEInsufficientBalanceError(
+        message=data.get("error", "Insufficient balance"),
+        status_code=status,
+        response=data,
+        balance=data.get("balance"),
+        required=data.get("required"),
+    )
+
+
+def _rate_limit_error(data: dict, status: int) -> VAPEError:
+    return VAPERateLimitError(
+        message=data.get("error", "Rate limit exceeded"),
+        status_code=status,
+        response=data,
+        retry_after=data.get("retry_after"),
+        limit_type=data.get("limit_type"),
+    )
+
+
+def _validation_error(data: dict, status: int) -> VAPEError:
+    return VAPEValidationError(
+        message=data.get("error", "Validation error"),
+        status_code=status,
+        response=data,
+        errors=data.get("errors"),
+    )
+
+
+_STATUS_ERRORS = MappingProxyType({
+    400: _validation_error,
+    401: _authentication_error,
+    402: _insufficient_balance_error,
+    429: _rate_limit_error,
+})
+
+
+def error_for_status(status: int, data: dict) -> VAPEError:
+    """Build the exception for a non-200 API response."""
+    factory = _STATUS_ERRORS.get(status)
+    if factory is not None:
+        return factory(data, status)
+    if status >= 500:
+        return VAPEServerError(
+            message=data.get("error", "Server error"),
+            status_code=status,
+            response=data,
+        )
+    return VAPEError(
+        message=data.get("error", f"Request failed with status {status}"),
+        status_code=status,
+        response=data,
+    )
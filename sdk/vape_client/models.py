@@ -3,12 +3,36 @@ VAP SDK Models
 Pydantic models for API responses
 """
 
+import sys
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
 
+from ._json import loads
 
-@dataclass
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# __slots__ instead of a per-instance __dict__ (dataclass(slots=...) is 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Where a finished task's output URL may appear, in order of preference
+_RESULT_KEYS = ("result_url", "image_url", "video_url", "audio_url")
+
+
+def _first_value(data: dict, keys: tuple) -> Any:
+    """Return the first truthy value of data[key] for key in keys."""
+    get = data.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return None
+
+
+@dataclass(**_SLOTS)
 class GenerateResult:
     """Result of image generation."""
     success: bool
@@ -35,7 +59,7 @@ class GenerateResult:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UpscaleResult:
     """Result of image upscaling."""
     success: bool
@@ -58,7 +82,7 @@ class UpscaleResult:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ValidationCheck:
     """Individual validation check result."""
     name: str
@@ -66,7 +90,7 @@ class ValidationCheck:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidateResult:
     """Result of image validation."""
     success: bool
@@ -96,7 +120,7 @@ class ValidateResult:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class HealthStatus:
     """API health status."""
     status: str
@@ -115,7 +139,7 @@ class HealthStatus:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Balance:
     """Client balance information."""
     balance: float
@@ -134,7 +158,7 @@ class Balance:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VideoResult:
     """Result of video generation."""
     success: bool
@@ -165,7 +189,7 @@ class VideoResult:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MusicResult:
     """Result of music generation."""
     success: bool
@@ -194,7 +218,7 @@ class MusicResult:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TaskResult:
     """Result of task status query."""
     task_id: str
@@ -214,7 +238,7 @@ class TaskResult:
             task_id=data.get("task_id", ""),
             status=data.get("status", "unknown"),
             task_type=data.get("task_type") or data.get("type"),
-            result_url=data.get("result_url") or data.get("image_url") or data.get("video_url") or data.get("audio_url"),
+            result_url=_first_value(data, _RESULT_KEYS),
             cost=data.get("cost", 0.0),
             created_at=data.get("created_at"),
             completed_at=data.get("completed_at"),
@@ -223,7 +247,7 @@ class TaskResult:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TaskListResult:
     """Result of task list query."""
     tasks: List["TaskResult"]
@@ -234,11 +258,33 @@ class TaskListResult:
     @classmethod
     def from_response(cls, data: dict) -> "TaskListResult":
         """Create from API response."""
-        tasks_data = data.get("tasks", [])
-        tasks = [TaskResult.from_response(t) for t in tasks_data]
+        from_task = TaskResult.from_response
+        tasks = [from_task(t) for t in data.get("tasks", ())]
         return cls(
             tasks=tasks,
             total=data.get("total", len(tasks)),
             limit=data.get("limit", 10),
             offset=data.get("offset", 0),
-        )
\ No newline at end of file
+        )
+
+# Models whose fields are exactly the response keys can be decoded by msgspec
+# straight from the body; the others need from_response's key mapping.
+if msgspec is not None:
+    _DECODERS = {
+        model: msgspec.json.Decoder(model).decode
+        for model in (GenerateResult, UpscaleResult, HealthStatus)
+    }
+else:
+    _DECODERS = {}
+
+
+def from_json(model, content: bytes):
+    """Build a model from a JSON response body."""
+    decode = _DECODERS.get(model)
+    if decode is not None:
+        try:
+            return decode(content)
+        except ValueError:
+            # Missing or unexpectedly typed fields: use from_response's defaults
+            pass
+    return model.from_response(loads(content))
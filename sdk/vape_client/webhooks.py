@@ -3,11 +3,88 @@ VAP Webhook Helpers
 Utilities for webhook signature verification
 """
 
-import hmac
-import hashlib
-import json
 import time
-from typing import Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union
+
+from ._json import canonical_dumps, loads
+
+if TYPE_CHECKING:
+    import hmac
+
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
+@lru_cache(maxsize=16)
+def _hmac_template(secret: bytes) -> "hmac.HMAC":
+    """
+    HMAC-SHA256 keyed with secret, to be .copy()'d per message.
+
+    Copying skips re-deriving the inner/outer key pads on every webhook.
+    Keyed on the secret, so only pass your own configured webhook secrets;
+    the cache holds at most 16.
+    """
+    import hashlib
+    import hmac
+
+    return hmac.new(secret, digestmod=hashlib.sha256)
+
+
+def _canonical_text(payload: str) -> bytes:
+    """Canonical JSON for a JSON string; non-JSON text is signed as-is."""
+    try:
+        payload = canonical_dumps(loads(payload))
+    except ValueError:
+        pass
+    return payload.encode("utf-8")
+
+
+def _canonical_bytes(payload) -> bytes:
+    return _canonical_text(bytes(payload).decode("utf-8"))
+
+
+def _canonical_object(payload) -> bytes:
+    return canonical_dumps(payload).encode("utf-8")
+
+
+# Payload type -> canonical signed form; subclasses are matched in _normalize
+_NORMALIZERS = {
+    dict: _canonical_object,
+    str: _canonical_text,
+    bytes: _canonical_bytes,
+    bytearray: _canonical_bytes,
+    memoryview: _canonical_bytes,
+}
+
+
+def _normalize(payload) -> bytes:
+    """Canonical signed form of a webhook payload."""
+    normalize = _NORMALIZERS.get(type(payload))
+    if normalize is None:
+        if isinstance(payload, str):
+            normalize = _canonical_text
+        elif isinstance(payload, _BYTES_LIKE):
+            normalize = _canonical_bytes
+        else:
+            normalize = _canonical_object
+    return normalize(payload)
+
+
+def _signed_message(ts: int, payload) -> bytes:
+    """The bytes VAP signs: b"<timestamp>." followed by the payload."""
+    return b"%d." % ts + payload
+
+
+def _sign(secret: str, message: bytes) -> bytes:
+    """
+    Raw HMAC-SHA256 of message under secret.
+
+    The message goes to a single update() call so hashlib can hash a large
+    body in one pass with the GIL released.
+    """
+    mac = _hmac_template(secret.encode("utf-8")).copy()
+    mac.update(message)
+    return mac.digest()
 
 
 def verify_webhook_signature(
@@ -16,6 +93,7 @@ def verify_webhook_signature(
     timestamp: Union[str, int],
     secret: str,
     max_age_seconds: int = 300,
+    raw_payload: bool = True,
 ) -> bool:
     """
     Verify VAP webhook signature.
@@ -23,12 +101,17 @@ def verify_webhook_signature(
     VAP sends webhooks with HMAC-SHA256 signatures for security.
     Use this function to verify that webhooks are authentic.
 
+    Pass the raw request body when you have it: bytes are first checked
+    exactly as received, and only re-serialized to canonical JSON if that
+    does not match.
+
     Args:
         payload: Webhook payload (dict, JSON string, or bytes)
         signature: Value from X-VAP-Signature header
         timestamp: Value from X-VAP-Timestamp header
         secret: Your webhook secret (from webhook registration)
         max_age_seconds: Maximum age of signature (default: 5 minutes)
+        raw_payload: Try bytes payloads verbatim before normalizing (default: True)
 
     Returns:
         True if signature is valid and not expired, False otherwise
@@ -50,6 +133,8 @@ def verify_webhook_signature(
 
             # Process webhook...
     """
+    from hmac import compare_digest
+
     try:
         # Convert timestamp to int
         ts = int(timestamp)
@@ -59,44 +144,35 @@ def verify_webhook_signature(
         if abs(current_time - ts) > max_age_seconds:
             return False
 
-        # Normalize payload to JSON string
-        if isinstance(payload, bytes):
-            payload = payload.decode("utf-8")
-        if isinstance(payload, dict):
-            payload_json = json.dumps(payload, separators=(",", ":"), sort_keys=True)
-        else:
-            # Try to parse and re-serialize for consistent formatting
-            try:
-                parsed = json.loads(payload)
-                payload_json = json.dumps(parsed, separators=(",", ":"), sort_keys=True)
-            except:
-                payload_json = payload
+        # Compare raw digests; also accepts upper-case hex
+        signature_bytes = bytes.fromhex(signature)
 
-        # Create signed payload
-        signed_payload = f"{ts}.{payload_json}"
+        # Fast path: the body exactly as it came off the wire
+        if raw_payload and isinstance(payload, _BYTES_LIKE) and compare_digest(
+            signature_bytes, _sign(secret, _signed_message(ts, payload))
+        ):
+            return True
 
-        # Generate expected signature
-        expected_signature = hmac.new(
-            secret.encode("utf-8"),
-            signed_payload.encode("utf-8"),
-            hashlib.sha256
-        ).hexdigest()
+        # Normalize payload to canonical JSON
+        expected_signature = _sign(secret, _signed_message(ts, _normalize(payload)))
 
         # Constant-time comparison
-        return hmac.compare_digest(signature, expected_signature)
+        return compare_digest(signature_bytes, expected_signature)
 
     except (ValueError, TypeError, AttributeError):
         return False
 
 
 def generate_webhook_signature(
-    payload: Union[dict, str],
+    payload: Union[dict, str, bytes],
     secret: str,
     timestamp: int = None,
 ) -> tuple:
     """
     Generate webhook signature (for testing purposes).
 
+    Bytes are signed exactly as given, so send the same bytes as the body.
+
     Args:
         payload: Webhook payload
         secret: Webhook secret
@@ -114,25 +190,14 @@ def generate_webhook_signature(
     if timestamp is None:
         timestamp = int(time.time())
 
-    # Normalize payload
-    if isinstance(payload, dict):
-        payload_json = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    if isinstance(payload, _BYTES_LIKE):
+        # Signed verbatim, as the receiver's fast path checks it
+        message = payload
     else:
-        try:
-            parsed = json.loads(payload)
-            payload_json = json.dumps(parsed, separators=(",", ":"), sort_keys=True)
-        except:
-            payload_json = payload
-
-    # Create signed payload
-    signed_payload = f"{timestamp}.{payload_json}"
+        message = _normalize(payload)
 
     # Generate signature
-    signature = hmac.new(
-        secret.encode("utf-8"),
-        signed_payload.encode("utf-8"),
-        hashlib.sha256
-    ).hexdigest()
+    signature = _sign(secret, _signed_message(timestamp, message)).hex()
 
     return signature, timestamp
 
@@ -193,11 +258,11 @@ class WebhookEvent:
         )
 
         # Parse payload
-        if isinstance(payload, bytes):
-            payload = payload.decode("utf-8")
+        if isinstance(payload, _BYTES_LIKE):
+            payload = bytes(payload).decode("utf-8")
         if isinstance(payload, str):
             try:
-                payload = json.loads(payload)
+                payload = loads(payload)
             except:
                 payload = {"raw": payload}
 